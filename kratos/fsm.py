@@ -1,4 +1,4 @@
-from _kratos import get_fn_ln
+from .util import get_fn_ln
 
 
 class FSM:
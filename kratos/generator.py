@@ -1,17 +1,30 @@
 import enum
+import weakref
 from .pyast import transform_stmt_block, add_scope_context, \
-    get_frame_local, AlwaysWrapper
-from .util import clog2, max_value, cast, VarCastType
+    get_frame_local, AlwaysWrapper, clear_src_cache, _RAW_STMT_TYPES
+from .util import clog2, max_value, cast, VarCastType, get_fn_ln, \
+    clear_fn_ln_cache
 from .stmts import if_, switch_, IfStmt, SwitchStmt
 from .ports import PortBundle
 from .fsm import FSM
 from .interface import InterfaceWrapper
 import _kratos
-from _kratos import get_fn_ln, StatementBlockType, BlockEdgeType, PortType, PortDirection
+from _kratos import StatementBlockType, BlockEdgeType, PortType, PortDirection
 from typing import List, Dict, Union, Tuple
 
 __GLOBAL_DEBUG = False
 
+# frequently used enum values, bound once instead of per call
+_PD_IN = PortDirection.In
+_PD_OUT = PortDirection.Out
+_PT_CLOCK = PortType.Clock
+_PT_CLOCK_EN = PortType.ClockEnable
+_PT_ARST = PortType.AsyncReset
+_PT_RST = PortType.Reset
+_BE_POS = BlockEdgeType.Posedge
+# edge names produced by the always_ff decorator parsing
+_EDGE = {"Posedge": _BE_POS, "Negedge": BlockEdgeType.Negedge}
+
 
 def set_global_debug(value: bool):
     global __GLOBAL_DEBUG
@@ -24,6 +37,8 @@ def get_global_debug():
 
 
 class CodeBlock:
+    __slots__ = ("block_type", "_generator", "_block")
+
     def __init__(self, generator, block_type: StatementBlockType,
                  debug_frame_depth):
         self.block_type = block_type
@@ -44,32 +59,50 @@ class CodeBlock:
             self._block.add_fn_ln((fn, ln))
 
     def add_stmt(self, stmt, add_fn_ln: bool = True, depth=2):
-        if hasattr(stmt, "stmt"):
-            self._block.add_stmt(stmt.stmt())
-        else:
+        if isinstance(stmt, _RAW_STMT_TYPES):
             self._block.add_stmt(stmt)
+        else:
+            self._block.add_stmt(stmt.stmt())
         if add_fn_ln and self._generator.debug:
             info = get_fn_ln(depth)
             stmt.add_fn_ln(info)
             add_scope_context(stmt, get_frame_local(depth))
 
+    def add_stmts(self, stmts):
+        # bulk insertion without debug info, used for transformed code blocks
+        self._block.add_stmts(stmts)
+
     def remove_stmt(self, stmt):
-        if hasattr(stmt, "stmt"):
-            self._block.remove_stmt(stmt.stmt())
-        else:
+        if isinstance(stmt, _RAW_STMT_TYPES):
             self._block.remove_stmt(stmt)
+        else:
+            self._block.remove_stmt(stmt.stmt())
 
     def stmt(self):
         return self._block
 
+    @property
+    def comment(self):
+        return self._block.comment
+
+    @comment.setter
+    def comment(self, value):
+        self._block.comment = value
+
     def if_(self, predicate: _kratos.Var) -> IfStmt:
         stmt = if_(predicate)
-        self.add_stmt(stmt.stmt(), depth=3)
+        if self._generator.debug:
+            self.add_stmt(stmt.stmt(), depth=3)
+        else:
+            self._block.add_stmt(stmt.stmt())
         return stmt
 
     def switch_(self, predicate: _kratos.Var) -> SwitchStmt:
         stmt = switch_(predicate)
-        self.add_stmt(stmt.stmt(), depth=3)
+        if self._generator.debug:
+            self.add_stmt(stmt.stmt(), depth=3)
+        else:
+            self._block.add_stmt(stmt.stmt())
         return stmt
 
     def __getitem__(self, item):
@@ -80,17 +113,24 @@ class CodeBlock:
 
 
 class SequentialCodeBlock(CodeBlock):
+    __slots__ = ()
+
     def __init__(self, generator, sensitivity_list,
                  debug_frame_depth: int = 4):
         super().__init__(generator, StatementBlockType.Sequential,
                          debug_frame_depth)
-        for cond, var in sensitivity_list:
-            assert isinstance(cond, BlockEdgeType)
-            assert isinstance(var, _kratos.Var)
-            self._block.add_condition([cond, var])
+        if __debug__:
+            # the binding type-checks as well; this only gives a clearer
+            # error and the whole loop is compiled out under -O
+            for cond, var in sensitivity_list:
+                assert isinstance(cond, BlockEdgeType)
+                assert isinstance(var, _kratos.Var)
+        self._block.add_conditions(sensitivity_list)
 
 
 class CombinationalCodeBlock(CodeBlock):
+    __slots__ = ()
+
     def __init__(self, generator,
                  debug_frame_depth: int = 4):
         super().__init__(generator, StatementBlockType.Combinational,
@@ -98,6 +138,8 @@ class CombinationalCodeBlock(CodeBlock):
 
 
 class InitialCodeBlock(CodeBlock):
+    __slots__ = ()
+
     def __init__(self, generator,
                  debug_frame_depth: int = 4):
         super().__init__(generator, StatementBlockType.Initial,
@@ -105,6 +147,8 @@ class InitialCodeBlock(CodeBlock):
 
 
 class FinalCodeBlock(CodeBlock):
+    __slots__ = ()
+
     def __init__(self, generator,
                  debug_frame_depth: int = 4):
         super().__init__(generator, StatementBlockType.Final,
@@ -112,6 +156,8 @@ class FinalCodeBlock(CodeBlock):
 
 
 class LatchCodeBlock(CodeBlock):
+    __slots__ = ()
+
     def __init__(self, generator,
                  debug_frame_depth: int = 4):
         super().__init__(generator, StatementBlockType.Latch,
@@ -140,22 +186,53 @@ def has_enum(name):
     return Generator.get_context().has_enum(name)
 
 
+# bumped whenever passes may have removed or replaced ports in the native
+# IR, which invalidates everything the port proxies have cached
+_proxy_epoch = 0
+
+
+def invalidate_proxy_caches():
+    global _proxy_epoch
+    _proxy_epoch += 1
+
+
 class PortProxy:
+    __slots__ = ("__generator", "__cache", "__epoch")
+
     def __init__(self, generator: "Generator"):
         self.__generator = generator
+        # resolved ports indexed by name
+        self.__cache = {}
+        self.__epoch = _proxy_epoch
 
     def __getitem__(self, key):
-        if self.__generator.internal_generator.has_port_bundle(key):
-            p = self.__generator.internal_generator.get_bundle_ref(key)
-        elif self.__generator.internal_generator.has_interface(key):
-            p = self.__generator.internal_generator.get_interface(key)
-        else:
-            p = self.__generator.internal_generator.get_port(key)
+        cache = self.__cache
+        if self.__epoch != _proxy_epoch:
+            cache.clear()
+            self.__epoch = _proxy_epoch
+        p = cache.get(key)
+        # ports can be renamed natively, so a hit is only good while the
+        # port still carries the name it was cached under
+        if p is not None:
+            if p.name == key:
+                return p
+            del cache[key]
+        gen = self.__generator.internal_generator
+        # bundles and interfaces are not cached, they don't carry a name
+        # to validate a hit against
+        if gen.has_port_bundle(key):
+            return gen.get_bundle_ref(key)
+        elif gen.has_interface(key):
+            return gen.get_interface(key)
+        p = gen.get_port(key)
         if p is None:
             raise AttributeError("{0} doesn't exist".format(key))
+        cache[key] = p
         return p
 
     def __getattr__(self, key):
+        # not memoized as an instance attribute: that would bypass the
+        # rename/epoch checks in __getitem__
         return self[key]
 
     def __contains__(self, key):
@@ -164,8 +241,13 @@ class PortProxy:
     def __iter__(self):
         return self.__generator.internal_generator.ports_iter()
 
+    def _invalidate(self, key):
+        self.__cache.pop(key, None)
+
 
 class ParamProxy:
+    __slots__ = ("__generator", )
+
     def __init__(self, generator: "Generator"):
         self.__generator = generator
 
@@ -186,6 +268,8 @@ class ParamProxy:
 
 
 class VarProxy:
+    __slots__ = ("__generator", )
+
     def __init__(self, generator):
         self.__generator = generator.internal_generator
 
@@ -206,6 +290,8 @@ class VarProxy:
 
 
 class InterfaceProxy:
+    __slots__ = ("__generator", )
+
     def __init__(self, generator):
         self.__generator = generator.internal_generator
 
@@ -217,14 +303,32 @@ class InterfaceProxy:
 
 
 class GeneratorMeta(type):
+    # every generator class, including indirect subclasses. weak so classes
+    # defined locally (e.g. in tests) can still be collected
+    _subclass_registry = weakref.WeakSet()
+
     def __init__(cls, name, bases, attrs):
         super().__init__(name, bases, attrs)
         cls._cache = {}
+        GeneratorMeta._subclass_registry.add(cls)
 
 
 class Generator(metaclass=GeneratorMeta):
-    __context = _kratos.Context()
+    # created on first use, see get_context()
+    __context = None
     __inspect_frame_depth: int = 2
+    # set to True in subclasses whose instances are not modified after
+    # construction. create() then hands out the cached instance itself on a
+    # cache hit instead of building a clone. the shared instance can only be
+    # added to a parent once, add_child_generator raises otherwise
+    _share_on_cache_hit = False
+
+    # subclasses still get a __dict__ for their own attributes
+    __slots__ = ("__generator", "__child_generator", "__cached_initialization",
+                 "__def_instance", "__reg_next_stmt", "__reg_init_stmt",
+                 "__reg_en_stmt", "__stmt_label_mapping", "__parent",
+                 "__debug", "ports", "params", "vars", "interfaces",
+                 "__weakref__")
 
     def __init__(self, name: str, debug: bool = False, is_clone: bool = False,
                  internal_generator=None):
@@ -243,10 +347,11 @@ class Generator(metaclass=GeneratorMeta):
             assert isinstance(internal_generator, _kratos.Generator)
             self.__generator = internal_generator
         else:
+            context = Generator.get_context()
             if not is_clone and len(name) > 0:
-                self.__generator = self.__context.generator(name)
+                self.__generator = context.generator(name)
             else:
-                self.__generator = self.__context.empty_generator()
+                self.__generator = context.empty_generator()
                 self.__generator.is_cloned = True
             self.__set_generator_name(name)
 
@@ -284,10 +389,11 @@ class Generator(metaclass=GeneratorMeta):
         :param instance_name: instance name of the child generator
         :return: Child generator
         """
-        assert instance_name in self.__child_generator, \
+        child = self.__child_generator.get(instance_name)
+        assert child is not None, \
             "{0} does not exist in {1}".format(instance_name,
                                                self.instance_name)
-        return self.__child_generator[instance_name]
+        return child
 
     @property
     def def_instance(self):
@@ -322,11 +428,12 @@ class Generator(metaclass=GeneratorMeta):
 
     @instance_name.setter
     def instance_name(self, name: str):
-        if self.__parent is not None:
+        parent = self.__parent() if self.__parent is not None else None
+        if parent is not None:
             old_name = self.__generator.instance_name
-            ref = self.__parent.__child_generator.pop(old_name)
+            ref = parent.__child_generator.pop(old_name)
             assert ref == self
-            self.__parent.__child_generator[name] = self
+            parent.__child_generator[name] = self
         self.__generator.instance_name = name
 
     @property
@@ -359,10 +466,12 @@ class Generator(metaclass=GeneratorMeta):
 
     @property
     def debug(self):
-        return self.__generator.debug
+        return self.__debug
 
     @debug.setter
     def debug(self, value):
+        # mirrored in python so the hot paths don't query the native handle
+        self.__debug = value
         self.__generator.debug = value
 
     @property
@@ -383,12 +492,16 @@ class Generator(metaclass=GeneratorMeta):
         size, params = self.__filter_size(size)
         if isinstance(width, _kratos.Enum):
             v = self.__generator.enum_var(name, width)
+            if self.__debug:
+                v.add_fn_ln(get_fn_ln())
         elif isinstance(width, _kratos.PackedStruct):
             v = self.__generator.var_packed(name, width, size)
+            if self.__debug:
+                v.add_fn_ln(get_fn_ln())
         else:
-            v = self.__generator.var(name, width, size, is_signed)
-        if self.debug:
-            v.add_fn_ln(get_fn_ln())
+            # debug info is attached by the binding
+            fn_ln = get_fn_ln() if self.__debug else None
+            v = self.__generator.var(name, width, size, is_signed, fn_ln)
         if not isinstance(width, _kratos.PackedStruct):
             v.is_packed = packed
             v.explicit_array = explicit_array
@@ -441,11 +554,13 @@ class Generator(metaclass=GeneratorMeta):
         size, params = self.__filter_size(size)
         if isinstance(width, _kratos.Enum):
             p = self.__generator.port(direction, name, width)
+            if self.__debug:
+                p.add_fn_ln(get_fn_ln())
         else:
+            # debug info is attached by the binding
+            fn_ln = get_fn_ln() if self.__debug else None
             p = self.__generator.port(direction, name, width, size,
-                                      port_type, is_signed)
-        if self.debug:
-            p.add_fn_ln(get_fn_ln())
+                                      port_type, is_signed, fn_ln)
         p.is_packed = packed
         p.explicit_array = explicit_array
         self.__set_var_size(p, params)
@@ -471,15 +586,18 @@ class Generator(metaclass=GeneratorMeta):
               explicit_array: bool = False) -> _kratos.Port:
         size, params = self.__filter_size(size)
         if isinstance(width, _kratos.Enum):
-            p = self.__generator.port(PortDirection.In, name, width)
+            p = self.__generator.port(_PD_IN, name, width)
+            if self.__debug:
+                p.add_fn_ln(get_fn_ln())
         elif isinstance(width, _kratos.PackedStruct):
-            p = self.__generator.port_packed(PortDirection.In, name,
+            p = self.__generator.port_packed(_PD_IN, name,
                                              width, size)
+            if self.__debug:
+                p.add_fn_ln(get_fn_ln())
         else:
-            p = self.__generator.port(PortDirection.In, name, width, size,
-                                      port_type, is_signed)
-        if self.debug:
-            p.add_fn_ln(get_fn_ln())
+            fn_ln = get_fn_ln() if self.__debug else None
+            p = self.__generator.port(_PD_IN, name, width, size,
+                                      port_type, is_signed, fn_ln)
         if not isinstance(width, _kratos.PackedStruct):
             p.is_packed = packed
             p.explicit_array = explicit_array
@@ -487,27 +605,24 @@ class Generator(metaclass=GeneratorMeta):
         return p
 
     def clock(self, name, is_input=True):
-        direction = PortDirection.In if is_input else PortDirection.Out
+        direction = _PD_IN if is_input else _PD_OUT
+        fn_ln = get_fn_ln() if self.__debug else None
         p = self.__generator.port(direction, name, 1, 1,
-                                  PortType.Clock, False)
-        if self.debug:
-            p.add_fn_ln(get_fn_ln())
+                                  _PT_CLOCK, False, fn_ln)
         return p
 
     def clock_en(self, name, is_input=True):
-        direction = PortDirection.In if is_input else PortDirection.Out
+        direction = _PD_IN if is_input else _PD_OUT
+        fn_ln = get_fn_ln() if self.__debug else None
         p = self.__generator.port(direction, name, 1, 1,
-                                  PortType.ClockEnable, False)
-        if self.debug:
-            p.add_fn_ln(get_fn_ln())
+                                  _PT_CLOCK_EN, False, fn_ln)
         return p
 
     def reset(self, name, is_input=True, is_async=True, active_high=None):
-        direction = PortDirection.In if is_input else PortDirection.Out
-        reset = PortType.AsyncReset if is_async else PortType.Reset
-        p = self.__generator.port(direction, name, 1, 1, reset, False)
-        if self.debug:
-            p.add_fn_ln(get_fn_ln())
+        direction = _PD_IN if is_input else _PD_OUT
+        reset = _PT_ARST if is_async else _PT_RST
+        fn_ln = get_fn_ln() if self.__debug else None
+        p = self.__generator.port(direction, name, 1, 1, reset, False, fn_ln)
         if active_high is not None:
             p.active_high = active_high
         return p
@@ -520,15 +635,18 @@ class Generator(metaclass=GeneratorMeta):
                explicit_array: bool = False) -> _kratos.Port:
         size, params = self.__filter_size(size)
         if isinstance(width, _kratos.Enum):
-            p = self.__generator.port(PortDirection.Out, name, width)
+            p = self.__generator.port(_PD_OUT, name, width)
+            if self.__debug:
+                p.add_fn_ln(get_fn_ln())
         elif isinstance(width, _kratos.PackedStruct):
-            p = self.__generator.port_packed(PortDirection.Out, name,
+            p = self.__generator.port_packed(_PD_OUT, name,
                                              width, size)
+            if self.__debug:
+                p.add_fn_ln(get_fn_ln())
         else:
-            p = self.__generator.port(PortDirection.Out, name, width,
-                                      size, port_type, is_signed)
-        if self.debug:
-            p.add_fn_ln(get_fn_ln())
+            fn_ln = get_fn_ln() if self.__debug else None
+            p = self.__generator.port(_PD_OUT, name, width,
+                                      size, port_type, is_signed, fn_ln)
         if not isinstance(width, _kratos.PackedStruct):
             p.is_packed = packed
             p.explicit_array = explicit_array
@@ -537,13 +655,13 @@ class Generator(metaclass=GeneratorMeta):
 
     def var_packed(self, name: str, struct_packed: _kratos.PortPackedStruct):
         v = self.__generator.var_packed(name, struct_packed)
-        if self.debug:
+        if self.__debug:
             v.add_fn_ln(get_fn_ln())
         return v
 
     def port_bundle(self, bundle_name, bundle: PortBundle):
         assert isinstance(bundle, PortBundle)
-        if self.debug:
+        if self.__debug:
             return self.__generator.add_bundle_port_def(bundle_name,
                                                         bundle.definition,
                                                         get_fn_ln())
@@ -554,13 +672,15 @@ class Generator(metaclass=GeneratorMeta):
     def parameter(self, name: str, width: int = 32, value=None,
                   is_signed: bool = False, initial_value=None,
                   is_raw_type: bool = False) -> _kratos.Param:
+        fn_ln = get_fn_ln() if self.__debug else None
         if is_raw_type:
-            param = self.__generator.parameter(name)
+            param = self.__generator.parameter(name, fn_ln)
         else:
             if isinstance(width, _kratos.Enum):
-                param = self.__generator.parameter(name, width)
+                param = self.__generator.parameter(name, width, fn_ln)
             else:
-                param = self.__generator.parameter(name, width, is_signed)
+                param = self.__generator.parameter(name, width, is_signed,
+                                                   fn_ln)
         if value is not None:
             param.value = value
         if initial_value is not None:
@@ -568,9 +688,6 @@ class Generator(metaclass=GeneratorMeta):
             # set value as well
             if value is None:
                 param.value = initial_value
-        if self.debug:
-            fn, ln = get_fn_ln()
-            param.add_fn_ln((fn, ln))
         return param
 
     # alias
@@ -594,6 +711,7 @@ class Generator(metaclass=GeneratorMeta):
     def remove_port(self, port_name):
         assert self.__generator.has_port(port_name)
         self.__generator.remove_port(port_name)
+        self.ports._invalidate(port_name)
 
     def remove_var(self, var_name):
         assert self.__generator.has_var(var_name)
@@ -626,43 +744,42 @@ class Generator(metaclass=GeneratorMeta):
         if block_type == StatementBlockType.Combinational:
             # it's a combinational block
             comb = CombinationalCodeBlock(self)
-            for stmt in stmts:
-                comb.add_stmt(stmt, False)
+            comb.add_stmts(stmts)
             node = comb
         elif block_type == StatementBlockType.Initial:
             # it's a initial block
             init = InitialCodeBlock(self)
-            for stmt in stmts:
-                init.add_stmt(stmt, False)
+            init.add_stmts(stmts)
             node = init
         elif block_type == StatementBlockType.Final:
             # final block
             f = FinalCodeBlock(self)
-            for stmt in stmts:
-                f.add_stmt(stmt, False)
+            f.add_stmts(stmts)
             node = f
         elif block_type == StatementBlockType.Latch:
             # it's a latch block
             latch = LatchCodeBlock(self)
-            for stmt in stmts:
-                latch.add_stmt(stmt, False)
+            latch.add_stmts(stmts)
             node = latch
         else:
             sensitivity_list = []
+            gen = self.__generator
+            var_cache = {}
             for edge, var_name in raw_sensitives:
-                edge = getattr(BlockEdgeType, edge)
+                edge = _EDGE[edge]
                 if isinstance(var_name, str):
-                    var = self.internal_generator.get_var(var_name)
+                    var = var_cache.get(var_name)
+                    if var is None:
+                        var = var_cache[var_name] = gen.get_var(var_name)
                 else:
                     assert isinstance(var_name, _kratos.Var)
                     var = var_name
                 sensitivity_list.append((edge, var))
             seq = SequentialCodeBlock(self, sensitivity_list)
-            for stmt in stmts:
-                seq.add_stmt(stmt, False)
+            seq.add_stmts(stmts)
             node = seq
         # add context vars
-        if self.debug and fn_ln is None:
+        if self.__debug and fn_ln is None:
             for stmt in stmts:
                 add_scope_context(stmt, get_frame_local(2))
         if comment:
@@ -683,8 +800,10 @@ class Generator(metaclass=GeneratorMeta):
     add_code = add_always
 
     def __assign(self, var_to, var_from):
-        correct_dir, correct_assign = self.__generator.correct_wire_direction(
-            var_to, var_from)
+        # only called from wire(), which already handled the clone case
+        gen = self.__generator
+        correct_dir, correct_assign = gen.correct_wire_direction(var_to,
+                                                                 var_from)
         if not correct_assign:
             raise ValueError(str(var_to) + " cannot be assign to " +
                              str(var_from) +
@@ -693,7 +812,7 @@ class Generator(metaclass=GeneratorMeta):
             stmt = var_to.assign(var_from)
         else:
             stmt = var_from.assign(var_to)
-        self.add_stmt(stmt, False)
+        gen.add_stmt(stmt)
         return stmt
 
     def wire(self, var_to, var_from,
@@ -702,11 +821,20 @@ class Generator(metaclass=GeneratorMeta):
              comment="", locals_=None, fn_ln=None, additional_frame=0,
              no_fn_ln=False):
         if self.is_cloned:
-            if self.debug and locals_ is None:
-                locals_ = get_frame_local(2 + additional_frame)
+            if self.__debug:
+                # resolve the call site now so the replay doesn't have to
+                # walk the stack again and records the original location
+                if locals_ is None:
+                    locals_ = get_frame_local(2 + additional_frame)
+                if fn_ln is None and not no_fn_ln:
+                    fn_ln = get_fn_ln(2 + additional_frame)
+            # the call site is already resolved, so the replay doesn't
+            # need an additional frame
             self.__cached_initialization.append((self.wire, [var_to, var_from,
                                                              attributes,
-                                                             comment, locals_]))
+                                                             comment, locals_,
+                                                             fn_ln, 0,
+                                                             no_fn_ln]))
             return
         # wire interface is a special treatment
         if isinstance(var_from, (_kratos.InterfaceRef, InterfaceWrapper)) or \
@@ -724,27 +852,30 @@ class Generator(metaclass=GeneratorMeta):
         # notice that we can figure out the direction automatically if
         # both of them are ports
         # handle port bundles
-        if isinstance(var_to, _kratos.PortBundleRef):
+        gen = self.__generator
+        debug = self.__debug
+        if type(var_to) is _kratos.PortBundleRef:
             assert isinstance(var_from, _kratos.PortBundleRef)
-            if self.debug:
-                entry = get_fn_ln(2 + additional_frame)
+            if debug:
+                entry = fn_ln if fn_ln is not None else \
+                    get_fn_ln(2 + additional_frame)
             else:
                 entry = []
-            var_from.assign(var_to, self.__generator, entry)
+            var_from.assign(var_to, gen, entry)
             return
         if isinstance(var_to, _kratos.Port) and isinstance(var_from,
                                                            _kratos.Port):
-            stmt = self.__generator.wire_ports(var_to, var_from)
+            stmt = gen.wire_ports(var_to, var_from)
         else:
             stmt = self.__assign(var_to, var_from)
 
-        if self.debug and not no_fn_ln:
-            if fn_ln is not None:
-                stmt.add_fn_ln(fn_ln)
-            else:
-                stmt.add_fn_ln(get_fn_ln(2 + additional_frame))
+        if debug and not no_fn_ln:
+            if fn_ln is None:
+                fn_ln = get_fn_ln(2 + additional_frame)
                 if locals_ is None:
                     locals_ = get_frame_local(2 + additional_frame)
+            stmt.add_fn_ln(fn_ln)
+            if locals_ is not None:
                 add_scope_context(stmt, locals_)
 
         if attributes is not None:
@@ -756,6 +887,45 @@ class Generator(metaclass=GeneratorMeta):
         if comment:
             stmt.comment = comment
 
+    def wire_many(self, pairs: List[Tuple[_kratos.Var, _kratos.Var]],
+                  attributes: Union[List[_kratos.passes.Attribute],
+                                    _kratos.passes.Attribute] = None,
+                  comment="", fn_ln=None, locals_=None):
+        """
+        Wire a list of (var_to, var_from) pairs with a single native call.
+        Only ports and variables are supported; use ``wire`` for interfaces
+        and port bundles.
+        :return: list of the created statements. A cloned generator only
+        records the call for ``initialize_clone`` and returns ``None``
+        """
+        debug = self.__debug
+        if debug:
+            # resolved at the call site so a clone replay records the
+            # original location and scope
+            if fn_ln is None:
+                fn_ln = get_fn_ln()
+            if locals_ is None:
+                locals_ = get_frame_local(2)
+        if self.is_cloned:
+            self.__cached_initialization.append((self.wire_many,
+                                                 [pairs, attributes, comment,
+                                                  fn_ln, locals_]))
+            return
+        stmts = self.__generator.wire_many(pairs, fn_ln)
+        if locals_ is not None:
+            for stmt in stmts:
+                add_scope_context(stmt, locals_)
+        if attributes is not None:
+            if not isinstance(attributes, list):
+                attributes = [attributes]
+            for stmt in stmts:
+                for attr in attributes:
+                    stmt.add_attribute(attr)
+        if comment:
+            for stmt in stmts:
+                stmt.comment = comment
+        return stmts
+
     def add_fsm(self, fsm_name: str, clk_name=None, reset_name=None,
                 reset_high=True):
         if clk_name is not None and reset_name is not None:
@@ -775,7 +945,7 @@ class Generator(metaclass=GeneratorMeta):
             self.__cached_initialization.append((self.add_stmt, [stmt]))
             return
         self.__generator.add_stmt(stmt)
-        if add_ln_info and self.debug:
+        if add_ln_info and self.__debug:
             stmt.add_fn_ln(get_fn_ln())
             add_scope_context(stmt, get_frame_local(2))
 
@@ -785,50 +955,65 @@ class Generator(metaclass=GeneratorMeta):
             return
         self.__generator.remove_stmt(stmt)
 
+    @staticmethod
+    def __check_no_parent(generator: "Generator"):
+        # a generator can only be instantiated once, e.g. a shared create()
+        # instance can't be added to several parents
+        parent = generator.__parent() if generator.__parent is not None \
+            else None
+        if parent is not None:
+            raise Exception(
+                "{0} is already instantiated as {1} in {2}".format(
+                    generator.name, generator.instance_name,
+                    parent.instance_name))
+
     def add_child_generator(self, instance_name: str, generator: "Generator",
                             comment="", python_only=False, **kargs):
         if self.is_cloned:
             self.__cached_initialization.append((self.add_child_generator,
                                                  (instance_name, generator)))
             return
-        if instance_name in self.__child_generator:
+        assert isinstance(generator,
+                          Generator), "generator is not a Generator instance"
+        # python only wrappers don't touch the native hierarchy
+        if not python_only:
+            Generator.__check_no_parent(generator)
+        # check and insert with a single lookup
+        if self.__child_generator.setdefault(instance_name,
+                                             generator) is not generator:
             raise Exception(
                 "{0} already exists in {1}".format(instance_name,
                                                    self.instance_name))
-        assert isinstance(generator,
-                          Generator), "generator is not a Generator instance"
-
-        self.__child_generator[instance_name] = generator
-        generator.__parent = self
+        # the parent keeps its children alive, not the other way around
+        generator.__parent = weakref.ref(self)
 
         if python_only:
             # only add it to the python level interface, the caller is
             # responsible for the connections etc
             return
-        else:
-            generator.__generator.instance_name = instance_name
 
-        if self.debug:
+        gen = self.__generator
+        child = generator.__generator
+        # the native add_child_generator sets the child's instance name
+        if self.__debug:
             fn, ln = get_fn_ln()
-            self.__generator.add_child_generator(instance_name,
-                                                 generator.__generator,
-                                                 (fn, ln))
+            gen.add_child_generator(instance_name, child, (fn, ln))
         else:
-            self.__generator.add_child_generator(instance_name,
-                                                 generator.__generator)
+            gen.add_child_generator(instance_name, child)
         if comment:
-            self.__generator.set_child_comment(instance_name, comment)
-
-        # set parameter values first
-        for child_param, parent_value in kargs.items():
-            if child_param in generator.params:
-                generator.params[child_param].value = parent_value
+            gen.set_child_comment(instance_name, comment)
+
+        # set parameter values first. everything else is a port connection
+        params = generator.params
+        connections = []
+        for name, value in kargs.items():
+            if name in params:
+                params[name].value = value
+            else:
+                connections.append((name, value))
 
         # bulk wiring
-        for child_port, parent_port in kargs.items():
-            # it can be parameter as well. we already taken care of that
-            if child_port in generator.params:
-                continue
+        for child_port, parent_port in connections:
             if isinstance(parent_port, str):
                 if parent_port in self.ports:
                     parent_port = self.ports[parent_port]
@@ -845,54 +1030,63 @@ class Generator(metaclass=GeneratorMeta):
             self.__cached_initialization.append((self.remove_child_generator,
                                                  [generator]))
             return
-        if generator.instance_name not in self.__child_generator:
+        if self.__child_generator.pop(generator.instance_name, None) is None:
             raise Exception("{0} doesn't exist in {1}".format(generator.name,
                                                               self.name))
-        self.__child_generator.pop(generator.instance_name)
+        generator.__parent = None
         self.__generator.remove_child_generator(generator.__generator)
 
     def replace(self, child_name: str, new_child: "Generator"):
         assert child_name in self.__child_generator
-        if self.debug:
+        Generator.__check_no_parent(new_child)
+        if self.__debug:
             debug_info = get_fn_ln()
             self.__generator.replace(child_name, new_child.internal_generator,
                                      debug_info)
         else:
             self.__generator.replace(child_name, new_child.internal_generator)
+        # the old child is detached natively and can be added elsewhere
+        self.__child_generator[child_name].__parent = None
         self.__child_generator[child_name] = new_child
+        new_child.__parent = weakref.ref(self)
 
     def child_generator(self):
         return self.__child_generator
 
     @staticmethod
     def clear_context():
-        Generator.__context.clear()
+        Generator.get_context().clear()
+        invalidate_proxy_caches()
         # also clean the caches
-        clses = Generator.__subclasses__()
-        for cls in clses:  # type: Generator
+        for cls in GeneratorMeta._subclass_registry:  # type: Generator
             cls._cache.clear()
         # clean the function calls
         from .func import clear_context
         clear_context()
+        # cached call sites and sources hold on to code objects
+        clear_fn_ln_cache()
+        clear_src_cache()
 
     @staticmethod
     def clear_context_hash():
-        Generator.__context.clear_hash()
+        Generator.get_context().clear_hash()
 
     @staticmethod
     def get_context():
-        return Generator.__context
+        context = Generator.__context
+        if context is None:
+            context = Generator.__context = _kratos.Context()
+        return context
 
     @staticmethod
     def from_verilog(top_name: str, src_file: str, lib_files: List[str],
                      port_mapping: Dict[str, PortType]):
         g = Generator("")
-        _port_mapping = {}
-        for name, _type in port_mapping.items():
-            _port_mapping[name] = _type
-        g.__generator = _kratos.Generator.from_verilog(Generator.__context,
+        # PortType is the native enum, so the mapping converts as is
+        g.__generator = _kratos.Generator.from_verilog(Generator.get_context(),
                                                        src_file, top_name,
-                                                       lib_files, _port_mapping)
+                                                       lib_files, port_mapping)
+        g.__debug = g.__generator.debug
         return g
 
     def __contains__(self, generator: "Generator"):
@@ -915,15 +1109,20 @@ class Generator(metaclass=GeneratorMeta):
 
     @classmethod
     def __cached_py_generator(cls, **kargs):
-        hash_value = 0
-        for key, value in kargs.items():
-            hash_value = hash_value ^ (hash(key) << 16) ^ hash(value)
-        if hash_value not in cls._cache:
+        # keyword order doesn't matter and equal hashes can't alias two
+        # different parameter sets
+        try:
+            key = frozenset(kargs.items())
+        except TypeError:
+            # unhashable argument values (lists etc.) can't be cached
+            return cls(**kargs), False
+        g = cls._cache.get(key)
+        if g is None:
             g = cls(**kargs)
-            cls._cache[hash_value] = g
+            cls._cache[key] = g
             return g, False
         else:
-            return cls._cache[hash_value], True
+            return g, True
 
     @classmethod
     def clone(cls, **kargs):
@@ -933,6 +1132,7 @@ class Generator(metaclass=GeneratorMeta):
         else:
             g = Generator("")
             g.__generator = gen.__generator.clone()
+            g.__debug = g.__generator.debug
             g.__def_instance = gen
             return g
 
@@ -943,7 +1143,7 @@ class Generator(metaclass=GeneratorMeta):
         if get_global_debug():
             return cls(**kargs)
         gen, cached = cls.__cached_py_generator(**kargs)
-        if not cached:
+        if not cached or cls._share_on_cache_hit:
             return gen
         else:
             kargs["is_clone"] = True
@@ -954,60 +1154,64 @@ class Generator(metaclass=GeneratorMeta):
 
     # list of helper functions similar to chisel, but force good naming
     # so that we can produce a readable verilog
-    def __get_port_name_type(self, port, port_type):
+    def __get_port_type(self, port, port_type):
         if port is None:
-            clock_names = self.__generator.get_ports(port_type)
-            assert len(clock_names) > 0, str(port_type) + " signal not found"
-            port = clock_names[0]
+            # not cached: ports can be added, renamed or retyped natively,
+            # which changes the default clock/reset
+            port_names = self.__generator.get_ports(port_type)
+            assert len(port_names) > 0, str(port_type) + " signal not found"
+            return self.ports[port_names[0]]
         if isinstance(port, str):
-            port = self.ports[port]
+            # the proxy raises if the port doesn't exist
+            return self.ports[port]
         assert self.__generator.has_port(port.name)
-        return port.name
+        return port
 
     def __get_var_assert(self, var):
         if isinstance(var, str):
             var = self.vars[var]
-            assert self.__generator.has_var(var.name)
         return var
 
     def __create_new_var(self, var_name, var_ref):
         new_var = self.var(var_name, var_ref.width, var_ref.signed,
                            var_ref.size)
-        if self.debug:
+        if self.__debug:
             new_var.add_fn_ln(get_fn_ln())
         return new_var
 
     def __add_stmt_with_debug(self, block, stmt):
-        if self.debug:
+        if self.__debug:
             stmt.add_fn_ln(get_fn_ln())
         block.add_stmt(stmt)
 
     def dpi(self, func_name):
         return self.__generator.dpi_function(func_name)
 
+    # the register helpers key their cached blocks on the identity of the
+    # native clock/reset/enable objects. the objects are stored along with the
+    # block so the ids cannot be recycled while the entry is alive
     def reg_next(self, var_name, var, clk=None):
-        clk_name = self.__get_port_name_type(clk, PortType.Clock)
-        clk = self.ports[clk_name]
-        if clk_name not in self.__reg_next_stmt:
-            self.__reg_next_stmt[clk_name] = self.sequential(
-                (BlockEdgeType.Posedge, clk))
+        clk = self.__get_port_type(clk, _PT_CLOCK)
+        entry = self.__reg_next_stmt.get(id(clk))
+        if entry is None:
+            entry = self.sequential((_BE_POS, clk)), clk
+            self.__reg_next_stmt[id(clk)] = entry
         var = self.__get_var_assert(var)
         new_var = self.__create_new_var(var_name, var)
-        self.__add_stmt_with_debug(self.__reg_next_stmt[clk_name],
-                                   new_var.assign(var))
+        self.__add_stmt_with_debug(entry[0], new_var.assign(var))
         return new_var
 
     def reg_init(self, var_name, var, clk=None, reset=None, init_value=0):
-        clk_name = self.__get_port_name_type(clk, PortType.Clock)
-        rst_name = self.__get_port_name_type(reset, PortType.AsyncReset)
-        clk = self.ports[clk_name]
-        reset = self.ports[rst_name]
-        if (clk_name, rst_name) not in self.__reg_init_stmt:
-            seq = self.sequential((BlockEdgeType.Posedge, clk),
-                                  (BlockEdgeType.Posedge, reset))
-            if_stmt = seq.if_(reset)
-            self.__reg_init_stmt[(clk_name, rst_name)] = if_stmt
-        if_stmt = self.__reg_init_stmt[(clk_name, rst_name)]
+        clk = self.__get_port_type(clk, _PT_CLOCK)
+        reset = self.__get_port_type(reset, _PT_ARST)
+        key = (id(clk), id(reset))
+        entry = self.__reg_init_stmt.get(key)
+        if entry is None:
+            seq = self.sequential((_BE_POS, clk),
+                                  (_BE_POS, reset))
+            entry = seq.if_(reset), clk, reset
+            self.__reg_init_stmt[key] = entry
+        if_stmt = entry[0]
         var = self.__get_var_assert(var)
         new_var = self.__create_new_var(var_name, var)
         self.__add_stmt_with_debug(if_stmt.else_body(), new_var.assign(var))
@@ -1016,22 +1220,23 @@ class Generator(metaclass=GeneratorMeta):
         return new_var
 
     def reg_enable(self, var_name, var, en, clk=None):
-        clk_name = self.__get_port_name_type(clk, PortType.Clock)
-        clk = self.ports[clk_name]
+        clk = self.__get_port_type(clk, _PT_CLOCK)
         if isinstance(var, str):
             var = self.ports[var]
-        assert self.__generator.has_var(var.name)
+        else:
+            assert self.__generator.has_var(var.name)
         if isinstance(en, str):
             en = self.ports[en]
-        assert self.__generator.has_var(en.name)
-        if (clk.name, en.name) not in self.__reg_en_stmt:
-            seq = self.sequential((BlockEdgeType.Posedge, clk))
-            if_stmt = seq.if_(en)
-            self.__reg_en_stmt[(clk_name, en.name)] = if_stmt
-        if_stmt = self.__reg_en_stmt[(clk_name, en.name)]
-        var = self.__get_var_assert(var)
+        else:
+            assert self.__generator.has_var(en.name)
+        key = (id(clk), id(en))
+        entry = self.__reg_en_stmt.get(key)
+        if entry is None:
+            seq = self.sequential((_BE_POS, clk))
+            entry = seq.if_(en), clk, en
+            self.__reg_en_stmt[key] = entry
         new_var = self.__create_new_var(var_name, var)
-        self.__add_stmt_with_debug(if_stmt.then_body(), new_var.assign(var))
+        self.__add_stmt_with_debug(entry[0].then_body(), new_var.assign(var))
         return new_var
 
     # meta values
@@ -1,5 +1,5 @@
 from _kratos.passes import *
-from .generator import Generator
+from .generator import Generator, invalidate_proxy_caches
 import _kratos
 from .debug import dump_debug_database
 from typing import Dict
@@ -114,6 +114,8 @@ def verilog(generator: Generator, optimize_if: bool = True,
         pass_manager.add_pass("sort_stmts")
 
     code_gen.run_passes()
+    # passes remove and replace vars, ports and bundles
+    invalidate_proxy_caches()
 
     # debug database
     if debug_db_filename:
@@ -127,6 +129,7 @@ def verilog(generator: Generator, optimize_if: bool = True,
         # need to remove the event statement since it doesn't have codegen
         post_pass_manager.add_pass("remove_event_stmts")
     post_pass_manager.run_passes(generator.internal_generator)
+    invalidate_proxy_caches()
 
     if compile_to_verilog:
         assert output_dir is None and filename is not None,\
@@ -149,32 +152,20 @@ def verilog(generator: Generator, optimize_if: bool = True,
         r = None
     else:
         src = code_gen.verilog_src()
-        result = [src]
         gen = generator.internal_generator
         if debug_fn_ln:
             info = _kratos.passes.extract_debug_info(gen)
-            result.append(info)
         else:
             info = {}
 
         # struct info
         struct_info = _kratos.passes.extract_struct_info(
             generator.internal_generator)
-        if len(struct_info) > 0:
-            result.append(struct_info)
-
         # dpi info
         dpi_func = _kratos.passes.extract_dpi_function(gen, int_dpi_interface)
-        if len(dpi_func) > 0:
-            result.append(dpi_func)
         enum_def = _kratos.passes.extract_enum_info(gen)
-        if len(enum_def) > 0:
-            result.append(enum_def)
-
         # interface info
         interface_info = _kratos.passes.extract_interface_info(gen)
-        if len(interface_info) > 0:
-            result.append(interface_info)
 
         if filename is not None:
             output_verilog(filename, src, info, struct_info, dpi_func, enum_def,
@@ -185,7 +176,18 @@ def verilog(generator: Generator, optimize_if: bool = True,
                 with open(filename, "w+") as f:
                     f.write(s)
             generator.internal_generator.verilog_fn = filename
-        r = result[0] if len(result) == 1 else result
+
+        if debug_fn_ln or struct_info or dpi_func or enum_def or \
+                interface_info:
+            r = [src]
+            if debug_fn_ln:
+                r.append(info)
+            for extra in (struct_info, dpi_func, enum_def, interface_info):
+                if extra:
+                    r.append(extra)
+        else:
+            # common case, only the source is returned
+            r = src
 
     return r
 
@@ -12,6 +12,15 @@ from _kratos import get_frame_local, StatementBlockType
 
 from .util import print_src
 
+# (filename, code object) -> (source, dedented source, filename,
+# first line number)
+_FN_SRC_CACHE = {}
+# generated source -> compiled code object
+_CODE_CACHE = {}
+# native statements (and function call vars) can be added as is, anything
+# else is a python wrapper that exposes the native statement via stmt()
+_RAW_STMT_TYPES = (_kratos.Stmt, _kratos.Var)
+
 
 def has_format_string():
     return sys.version_info[1] >= 7
@@ -21,7 +30,26 @@ def __pretty_source(source):
     return "".join(source)
 
 
-class LogicOperatorVisitor(ast.NodeTransformer):
+class NodeTransformer(ast.NodeTransformer):
+    # ast.NodeVisitor.visit builds the "visit_" + class name string and
+    # does a getattr for every node it walks. the handler is resolved once
+    # per node type and visitor class instead
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._visit_table = {}
+
+    def visit(self, node):
+        node_type = node.__class__
+        method = self._visit_table.get(node_type)
+        if method is None:
+            cls = type(self)
+            method = getattr(cls, "visit_" + node_type.__name__,
+                             cls.generic_visit)
+            self._visit_table[node_type] = method
+        return method(self, node)
+
+
+class LogicOperatorVisitor(NodeTransformer):
     def __init__(self, local, global_, filename, scope_ln):
         self.local = local
         self.global_ = global_
@@ -84,8 +112,8 @@ class LogicOperatorVisitor(ast.NodeTransformer):
         return node
 
 
-class StaticElaborationNodeForVisitor(ast.NodeTransformer):
-    class NameVisitor(ast.NodeTransformer):
+class StaticElaborationNodeForVisitor(NodeTransformer):
+    class NameVisitor(NodeTransformer):
         def __init__(self, target, value):
             self.target = target
             self.value = value
@@ -273,7 +301,7 @@ class StaticElaborationNodeForVisitor(ast.NodeTransformer):
             return new_node
 
 
-class StaticElaborationNodeIfVisitor(ast.NodeTransformer):
+class StaticElaborationNodeIfVisitor(NodeTransformer):
     def __init__(self, generator, fn_src, scope, local, global_, filename, func_ln):
         super().__init__()
         self.generator = generator
@@ -403,7 +431,7 @@ class StaticElaborationNodeIfVisitor(ast.NodeTransformer):
         return self.visit(ast.Expr(value=else_node))
 
 
-class AugAssignNodeVisitor(ast.NodeTransformer):
+class AugAssignNodeVisitor(NodeTransformer):
     def visit_AugAssign(self, node):
         # change any aug assign to normal assign
         return ast.Assign(targets=[node.target],
@@ -412,7 +440,7 @@ class AugAssignNodeVisitor(ast.NodeTransformer):
                           lineno=node.lineno)
 
 
-class AssignNodeVisitor(ast.NodeTransformer):
+class AssignNodeVisitor(NodeTransformer):
     def __init__(self, generator, debug):
         super().__init__()
         self.generator = generator
@@ -439,7 +467,7 @@ class AssignNodeVisitor(ast.NodeTransformer):
         return new_node
 
 
-class AssertNodeVisitor(ast.NodeTransformer):
+class AssertNodeVisitor(NodeTransformer):
     def __init__(self, generator, debug):
         super().__init__()
         self.generator = generator
@@ -461,7 +489,7 @@ class AssertNodeVisitor(ast.NodeTransformer):
         return node
 
 
-class ExceptionNodeVisitor(ast.NodeTransformer):
+class ExceptionNodeVisitor(NodeTransformer):
     def __init__(self, generator, debug):
         super().__init__()
         self.generator = generator
@@ -484,7 +512,7 @@ class ExceptionNodeVisitor(ast.NodeTransformer):
                                            attr="assert_", ctx=ast.Load()), args=args, keywords=[], lineno=node.lineno)
 
 
-class ReturnNodeVisitor(ast.NodeTransformer):
+class ReturnNodeVisitor(NodeTransformer):
     def __init__(self, scope_name, debug=False):
         self.scope_name = scope_name
         self.debug = debug
@@ -506,7 +534,7 @@ class ReturnNodeVisitor(ast.NodeTransformer):
             lineno=node.lineno)
 
 
-class GenVarLocalVisitor(ast.NodeTransformer):
+class GenVarLocalVisitor(NodeTransformer):
     def __init__(self, key, value, scope_name):
         self.key = key
         self.value = value
@@ -528,7 +556,7 @@ class GenVarLocalVisitor(ast.NodeTransformer):
 
 def transform_event(ast_tree, debug, fn, ln):
     # need to transform transaction @ event syntax into the one that supports fn ln
-    class ChangeMatMult(ast.NodeTransformer):
+    class ChangeMatMult(NodeTransformer):
         def visit_BinOp(self, node: ast.BinOp):
             if not isinstance(node.op, ast.MatMult):
                 return node
@@ -552,7 +580,7 @@ def transform_always_comb_ssa(ast_tree, gen, _locals):
             self.created_vars = {}
             self.enable_cond = []
 
-    class SSAVisitor(ast.NodeTransformer):
+    class SSAVisitor(NodeTransformer):
         # https://github.com/usagitoneko97/python-static-code-analysis/tree/master/cfg_and_ssa
         def __init__(self):
             self.vars = set()
@@ -750,16 +778,16 @@ class Scope:
 
                 self.scope = scope
                 for stmt in args:
-                    if hasattr(stmt, "stmt"):
+                    if not isinstance(stmt, _RAW_STMT_TYPES):
                         stmt = stmt.stmt()
                     self._if.add_then_stmt(stmt)
 
             def else_(self, *_args, f_ln=None):
                 for stmt in _args:
-                    if hasattr(stmt, "stmt"):
-                        self._if.add_else_stmt(stmt.stmt())
-                    else:
+                    if isinstance(stmt, _RAW_STMT_TYPES):
                         self._if.add_else_stmt(stmt)
+                    else:
+                        self._if.add_else_stmt(stmt.stmt())
                 if f_ln is not None:
                     fn_ln = (self.scope.filename, f_ln + self.scope.ln - 1)
                     self._if.else_body().add_fn_ln(fn_ln, True)
@@ -793,10 +821,10 @@ class Scope:
 
             def loop(self, *args):
                 for stmt in args:
-                    if hasattr(stmt, "stmt"):
-                        self.__for.add_stmt(stmt.stmt())
-                    else:
+                    if isinstance(stmt, _RAW_STMT_TYPES):
                         self.__for.add_stmt(stmt)
+                    else:
+                        self.__for.add_stmt(stmt.stmt())
                 return self
 
             def stmt(self):
@@ -1033,9 +1061,9 @@ def transform_stmt_block(generator, fn, unroll_for=False, apply_ssa=False, fn_ln
                           "deprecated soon. Please use @always_ff or "
                           "@always_comb", SyntaxWarning)
             print_src(get_fn(fn), get_ln(fn))
-        fn_src = inspect.getsource(fn)
+        fn_src, dedent_src, filename, ln = get_fn_src(fn)
         fn_name = fn.__name__
-        func_tree = ast.parse(textwrap.dedent(fn_src))
+        func_tree = ast.parse(dedent_src)
     else:
         assert isinstance(fn, ast.FunctionDef)
         # user directly passed in ast nodes
@@ -1048,8 +1076,8 @@ def transform_stmt_block(generator, fn, unroll_for=False, apply_ssa=False, fn_ln
     # needs debug
     debug = generator.debug
     store_local = debug and fn_ln is None
-    filename = get_fn(fn) if fn_ln is None else fn_ln[0]
-    ln = get_ln(fn) if fn_ln is None else fn_ln[1]
+    if fn_ln is not None:
+        filename, ln = fn_ln
 
     # extract the sensitivity list from the decorator
     blk_type, sensitivity = extract_sensitivity_from_dec(fn_body.decorator_list, fn_name)
@@ -1073,7 +1101,7 @@ def transform_stmt_block(generator, fn, unroll_for=False, apply_ssa=False, fn_ln
 
     src = astor.to_source(func_tree, pretty_source=__pretty_source)
     src = inject_import_code(src)
-    code_obj = compile(src, "<ast>", "exec")
+    code_obj = compile_src(src)
 
     # notice that this ln is an offset
     _locals.update({"_self": generator, "_scope": scope})
@@ -1088,9 +1116,9 @@ def transform_stmt_block(generator, fn, unroll_for=False, apply_ssa=False, fn_ln
 
 
 def transform_function_block(generator, fn, arg_types):
-    fn_src = inspect.getsource(fn)
+    fn_src, dedent_src, filename, ln = get_fn_src(fn)
     fn_name = fn.__name__
-    func_tree = ast.parse(textwrap.dedent(fn_src))
+    func_tree = ast.parse(dedent_src)
     fn_body = func_tree.body[0]
     # needs debug
     debug = generator.debug
@@ -1104,15 +1132,13 @@ def transform_function_block(generator, fn, arg_types):
     # only keep self
     fn_body.args.args = [func_args[0]]
     # add function args now
-    filename = get_fn(fn)
-    ln = get_ln(fn)
     scope = FuncScope(generator, fn_name, filename, ln)
     # add var creations
     arg_order = extract_arg_name_order_from_ast(func_args)
     var_body = declare_var_definition(arg_types, arg_order)
     var_src = astor.to_source(ast.Module(body=var_body))
     pre_locals = {"_scope": scope}
-    var_code_obj = compile(var_src, "<ast>", "exec")
+    var_code_obj = compile_src(var_src)
     exec(var_code_obj, pre_locals)
     _locals, _globals = __ast_transform_blocks(generator, func_tree, fn_src,
                                                fn_name, scope, insert_self,
@@ -1122,7 +1148,7 @@ def transform_function_block(generator, fn, arg_types):
 
     src = astor.to_source(func_tree)
     src = inject_import_code(src)
-    code_obj = compile(src, "<ast>", "exec")
+    code_obj = compile_src(src)
 
     _locals.update({"_self": generator, "_scope": scope})
     _globals.update(_locals)
@@ -1153,8 +1179,7 @@ def extract_arg_name_order_from_ast(func_args):
 
 
 def extract_arg_name_order_from_fn(fn):
-    fn_src = inspect.getsource(fn)
-    func_tree = ast.parse(textwrap.dedent(fn_src))
+    func_tree = ast.parse(get_fn_src(fn)[1])
     fn_body = func_tree.body[0]
     func_args = fn_body.args.args
     return extract_arg_name_order_from_ast(func_args)
@@ -1211,6 +1236,37 @@ def extract_sensitivity_from_dec(deco_list, fn_name):
         return blk_type, result
 
 
+def get_fn_src(fn):
+    # the source of a function never changes within a process, so the
+    # expensive inspect calls are done once per code object. code objects
+    # compare equal across files, hence the filename in the key
+    code = getattr(fn, "__code__", None)
+    key = (code.co_filename, code) if code is not None else None
+    entry = _FN_SRC_CACHE.get(key) if key is not None else None
+    if entry is None:
+        lines, ln = inspect.getsourcelines(fn)
+        fn_src = "".join(lines)
+        entry = fn_src, textwrap.dedent(fn_src), get_fn(fn), ln
+        if key is not None:
+            _FN_SRC_CACHE[key] = entry
+    return entry
+
+
+def compile_src(src):
+    # generators created from the same class usually transform into the same
+    # source, which only needs to be compiled once
+    code_obj = _CODE_CACHE.get(src)
+    if code_obj is None:
+        code_obj = compile(src, "<ast>", "exec")
+        _CODE_CACHE[src] = code_obj
+    return code_obj
+
+
+def clear_src_cache():
+    _FN_SRC_CACHE.clear()
+    _CODE_CACHE.clear()
+
+
 def get_ln(fn):
     info = inspect.getsourcelines(fn)
     return info[1]
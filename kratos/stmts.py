@@ -1,10 +1,11 @@
 import _kratos
-from .util import const
+from .util import const, get_fn_ln
 from typing import Union, List
-from _kratos import get_fn_ln
 
 
 class IfStmt:
+    __slots__ = ("_stmt", "__generator")
+
     def __init__(self, predicate: _kratos.Var):
         self._stmt = _kratos.IfStmt(predicate)
         self.__generator = predicate.generator
@@ -41,6 +42,14 @@ class IfStmt:
     def stmt(self):
         return self._stmt
 
+    @property
+    def comment(self):
+        return self._stmt.comment
+
+    @comment.setter
+    def comment(self, value):
+        self._stmt.comment = value
+
     def add_fn_ln(self, info):
         self._stmt.add_fn_ln(info)
 
@@ -50,6 +59,8 @@ def if_(predicate: _kratos.Var):
 
 
 class SwitchStmt:
+    __slots__ = ("_stmt", "__predicate", "__generator")
+
     def __init__(self, predicate: _kratos.Var):
         self._stmt = _kratos.SwitchStmt(predicate)
         if predicate.generator.debug:
@@ -73,6 +84,14 @@ class SwitchStmt:
     def stmt(self):
         return self._stmt
 
+    @property
+    def comment(self):
+        return self._stmt.comment
+
+    @comment.setter
+    def comment(self, value):
+        self._stmt.comment = value
+
     def add_scope_variable(self, name, value, is_var=False, override=False):
         self._stmt.add_scope_variable(name, value, is_var, override)
 
@@ -82,6 +101,8 @@ def switch_(predicate: _kratos.Var):
 
 
 class RawStringStmt:
+    __slots__ = ("_stmt", )
+
     def __init__(self, value: Union[str, List[str]]):
         self._stmt = _kratos.RawStringStmt(value)
 
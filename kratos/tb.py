@@ -1,7 +1,7 @@
 import _kratos
 from .generator import Generator, transform_stmt_block, \
     InitialCodeBlock, VarProxy, StatementBlockType
-from _kratos import get_fn_ln
+from .util import get_fn_ln
 
 
 def assert_(expr):
@@ -84,8 +84,11 @@ class TestBench:
         elif block_type == StatementBlockType.Initial:
             # it's a initial block
             init = InitialCodeBlock(self)
-            for stmt in stmts:
-                init.add_stmt(stmt)
+            if self.debug:
+                for stmt in stmts:
+                    init.add_stmt(stmt)
+            else:
+                init.add_stmts(stmts)
             node = init
         else:
             node = None
@@ -49,6 +49,35 @@ def print_src(src, line_no: Union[List[int], int], offset: int = 1,
     print(CLIColors.OKBLUE + "-" * 80 + CLIColors.ENDC, file=sys.stderr)
 
 
+# (filename, code object, bytecode offset) -> (filename, line number)
+_FN_LN_CACHE = {}
+
+
+def get_fn_ln(depth: int = 2):
+    # same frame semantics as the native implementation: depth 1 is the
+    # caller of get_fn_ln, depth 2 is its caller, and so on
+    try:
+        frame = sys._getframe(max(depth, 1))
+    except ValueError:
+        # not that many frames; use the outermost one
+        frame = sys._getframe(1)
+        while frame.f_back is not None:
+            frame = frame.f_back
+    code = frame.f_code
+    # identical code objects from different files compare equal, so the
+    # filename has to be part of the key
+    key = (code.co_filename, code, frame.f_lasti)
+    info = _FN_LN_CACHE.get(key)
+    if info is None:
+        info = (os.path.abspath(code.co_filename), frame.f_lineno)
+        _FN_LN_CACHE[key] = info
+    return info
+
+
+def clear_fn_ln_cache():
+    _FN_LN_CACHE.clear()
+
+
 def clog2(x: Union[int, _kratos.Var]) -> Union[int, _kratos.Var]:
     if isinstance(x, _kratos.Var):
         from kratos.func import get_built_in
@@ -114,9 +143,13 @@ class VarCastType(enum.Enum):
     ClockEn = _kratos.VarCastType.ClockEnable
 
 
+# Enum.value goes through a descriptor on every access
+_CAST_VALUES = {cast_type: cast_type.value for cast_type in VarCastType}
+
+
 def cast(var, cast_type, **kargs):
     assert isinstance(var, _kratos.Var)
-    _v = var.cast(cast_type.value)
+    _v = var.cast(_CAST_VALUES[cast_type])
     for k, v in kargs.items():
         setattr(_v, k, v)
     return _v
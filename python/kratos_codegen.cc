@@ -11,7 +11,8 @@ void init_code_gen(py::module &m) {
     using namespace kratos;
     py::class_<VerilogModule>(m, "VerilogModule")
         .def(py::init<Generator *>())
-        .def("verilog_src", &VerilogModule::verilog_src)
+        .def("verilog_src", &VerilogModule::verilog_src,
+             py::call_guard<py::gil_scoped_release>())
         .def("run_passes", &VerilogModule::run_passes)
         .def("pass_manager", &VerilogModule::pass_manager, py::return_value_policy::reference);
 
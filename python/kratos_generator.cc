@@ -14,10 +14,64 @@
 namespace py = pybind11;
 using std::shared_ptr;
 
+using FnLn = std::optional<std::pair<std::string, uint32_t>>;
+
+// port creation with the python call site attached in the same binding call.
+// width can be either a constant or a parameter
+template <typename W, typename S>
+kratos::Port &port_fn_ln(kratos::Generator &gen, kratos::PortDirection dir,
+                         const std::string &name, const W &width, const S &size,
+                         kratos::PortType t, bool is_signed, const FnLn &fn_ln) {
+    if constexpr (std::is_same_v<W, shared_ptr<kratos::Var>>) {
+        auto &p = gen.port(dir, name, 1, size, t, is_signed);
+        p.set_width_param(width);
+        if (fn_ln) p.fn_name_ln.emplace_back(*fn_ln);
+        return p;
+    } else {
+        auto &p = gen.port(dir, name, width, size, t, is_signed);
+        if (fn_ln) p.fn_name_ln.emplace_back(*fn_ln);
+        return p;
+    }
+}
+
+// same as port_fn_ln for variables
+template <typename W, typename S>
+kratos::Var &var_fn_ln(kratos::Generator &gen, const std::string &name, const W &width,
+                       const S &size, bool is_signed, const FnLn &fn_ln) {
+    if constexpr (std::is_same_v<W, shared_ptr<kratos::Var>>) {
+        auto &v = gen.var(name, 1, size, is_signed);
+        v.set_width_param(width);
+        if (fn_ln) v.fn_name_ln.emplace_back(*fn_ln);
+        return v;
+    } else {
+        auto &v = gen.var(name, width, size, is_signed);
+        if (fn_ln) v.fn_name_ln.emplace_back(*fn_ln);
+        return v;
+    }
+}
+
 void init_generator(py::module &m) {
     using namespace kratos;
     auto generator = py::class_<Generator, ::shared_ptr<Generator>, IRNode>(m, "Generator");
-    generator.def("from_verilog", &Generator::from_verilog, py::return_value_policy::reference)
+    generator
+        .def(
+            "from_verilog",
+            [](Context *context, const std::string &src_file, const std::string &top_name,
+               const std::vector<std::string> &lib_files,
+               const std::map<std::string, PortType> &port_types) -> Generator & {
+                std::shared_ptr<Generator> mod;
+                {
+                    // reading and parsing the file is pure C++ and can take a while on
+                    // large files. the context is shared with every other generator, so
+                    // it is only updated once the GIL is held again
+                    py::gil_scoped_release release;
+                    mod = Generator::parse_verilog(context, src_file, top_name, lib_files,
+                                                   port_types);
+                }
+                context->add(mod.get());
+                return *mod;
+            },
+            py::return_value_policy::reference)
         .def("var", py::overload_cast<const std::string &, uint32_t>(&Generator::var),
              py::return_value_policy::reference)
         .def("var",
@@ -51,6 +105,13 @@ void init_generator(py::module &m) {
             py::return_value_policy::reference)
         .def("var", py::overload_cast<const Var &, const std::string &>(&Generator::var),
              py::return_value_policy::reference)
+        .def("var", &var_fn_ln<uint32_t, uint32_t>, py::return_value_policy::reference)
+        .def("var", &var_fn_ln<uint32_t, std::vector<uint32_t>>,
+             py::return_value_policy::reference)
+        .def("var", &var_fn_ln<std::shared_ptr<Var>, uint32_t>,
+             py::return_value_policy::reference)
+        .def("var", &var_fn_ln<std::shared_ptr<Var>, std::vector<uint32_t>>,
+             py::return_value_policy::reference)
         .def("port",
              py::overload_cast<PortDirection, const std::string &, uint32_t>(&Generator::port),
              py::return_value_policy::reference)
@@ -82,6 +143,13 @@ void init_generator(py::module &m) {
                 return p;
             },
             py::return_value_policy::reference)
+        .def("port", &port_fn_ln<uint32_t, uint32_t>, py::return_value_policy::reference)
+        .def("port", &port_fn_ln<uint32_t, std::vector<uint32_t>>,
+             py::return_value_policy::reference)
+        .def("port", &port_fn_ln<std::shared_ptr<Var>, uint32_t>,
+             py::return_value_policy::reference)
+        .def("port", &port_fn_ln<std::shared_ptr<Var>, std::vector<uint32_t>>,
+             py::return_value_policy::reference)
         .def("port",
              py::overload_cast<PortDirection, const std::string &, const std::shared_ptr<Enum> &>(
                  &Generator::port),
@@ -131,6 +199,32 @@ void init_generator(py::module &m) {
              py::overload_cast<const std::string &, const std::shared_ptr<Enum> &>(
                  &Generator::parameter),
              py::return_value_policy::reference)
+        .def(
+            "parameter",
+            [](Generator &generator, const std::string &name, const FnLn &fn_ln) -> auto & {
+                auto &param = generator.parameter(name);
+                if (fn_ln) param.fn_name_ln.emplace_back(*fn_ln);
+                return param;
+            },
+            py::return_value_policy::reference)
+        .def(
+            "parameter",
+            [](Generator &generator, const std::string &name, uint32_t width, bool is_signed,
+               const FnLn &fn_ln) -> auto & {
+                auto &param = generator.parameter(name, width, is_signed);
+                if (fn_ln) param.fn_name_ln.emplace_back(*fn_ln);
+                return param;
+            },
+            py::return_value_policy::reference)
+        .def(
+            "parameter",
+            [](Generator &generator, const std::string &name, const std::shared_ptr<Enum> &def,
+               const FnLn &fn_ln) -> auto & {
+                auto &param = generator.parameter(name, def);
+                if (fn_ln) param.fn_name_ln.emplace_back(*fn_ln);
+                return param;
+            },
+            py::return_value_policy::reference)
         .def("interface", [](Generator &generator, const std::shared_ptr<InterfaceDefinition> &def,
                              const std::string &name,
                              bool is_port) { return generator.interface(def, name, is_port); })
@@ -223,6 +317,37 @@ void init_generator(py::module &m) {
         .def("set_is_stub", &Generator::set_is_stub)
         .def("wire_ports", &Generator::wire_ports)
         .def("wire", &Generator::wire)
+        .def("wire_many",
+             [](Generator &gen,
+                const std::vector<std::pair<std::shared_ptr<Var>, std::shared_ptr<Var>>> &pairs,
+                const std::optional<std::pair<std::string, uint32_t>> &fn_ln) {
+                 // bulk version of the python-side wire(). ports are wired with
+                 // direction check, everything else is assigned in the correct
+                 // direction and added to the generator
+                 std::vector<std::shared_ptr<Stmt>> stmts;
+                 stmts.reserve(pairs.size());
+                 for (auto const &[var_to, var_from] : pairs) {
+                     std::shared_ptr<Stmt> stmt;
+                     auto port_to = std::dynamic_pointer_cast<Port>(var_to);
+                     auto port_from = std::dynamic_pointer_cast<Port>(var_from);
+                     if (port_to && port_from) {
+                         stmt = gen.wire_ports(port_to, port_from);
+                     } else {
+                         auto [correct_dir, correct_assign] =
+                             gen.correct_wire_direction(var_to, var_from);
+                         if (!correct_assign) {
+                             throw py::value_error(var_to->to_string() + " cannot be assign to " +
+                                                   var_from->to_string() +
+                                                   ". Please check your module hierarchy");
+                         }
+                         stmt = correct_dir ? var_to->assign(var_from) : var_from->assign(var_to);
+                         gen.add_stmt(stmt);
+                     }
+                     if (fn_ln) stmt->fn_name_ln.emplace_back(*fn_ln);
+                     stmts.emplace_back(stmt);
+                 }
+                 return stmts;
+             })
         .def("unwire", &Generator::unwire)
         .def("wire_interface", &Generator::wire_interface)
         .def("correct_wire_direction", &Generator::correct_wire_direction)
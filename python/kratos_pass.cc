@@ -35,10 +35,10 @@ void init_pass(py::module &m) {
         .def("transform_if_to_case", &transform_if_to_case)
         .def("remove_fanout_one_wires", &remove_fanout_one_wires)
         .def("remove_pass_through_modules", &remove_pass_through_modules)
-        .def("extract_debug_info", &extract_debug_info)
+        .def("extract_debug_info", &extract_debug_info, py::call_guard<py::gil_scoped_release>())
         .def("compute_enable_condition", &compute_enable_condition)
-        .def("extract_struct_info", &extract_struct_info)
-        .def("extract_enum_info", &extract_enum_info)
+        .def("extract_struct_info", &extract_struct_info, py::call_guard<py::gil_scoped_release>())
+        .def("extract_enum_info", &extract_enum_info, py::call_guard<py::gil_scoped_release>())
         .def("merge_wire_assignments", merge_wire_assignments)
         .def("zero_out_stubs", &zero_out_stubs)
         .def("remove_unused_stmts", &remove_unused_stmts)
@@ -50,8 +50,10 @@ void init_pass(py::module &m) {
         .def("check_function_return", &check_function_return)
         .def("sort_stmts", &sort_stmts)
         .def("check_active_high", &check_active_high)
-        .def("extract_dpi_function", &extract_dpi_function)
-        .def("extract_interface_info", &extract_interface_info)
+        .def("extract_dpi_function", &extract_dpi_function,
+             py::call_guard<py::gil_scoped_release>())
+        .def("extract_interface_info", &extract_interface_info,
+             py::call_guard<py::gil_scoped_release>())
         .def("extract_debug_break_points", &extract_debug_break_points)
         .def("insert_verilator_public", &insert_verilator_public)
         .def("remove_assertion", &remove_assertion)
@@ -83,6 +83,22 @@ void init_stmt(py::module &m) {
                  auto st = std::make_shared<FunctionCallStmt>(var);
                  stmt.add_stmt(st);
              })
+        .def("add_stmts",
+             [](StmtBlock &stmt, const py::iterable &stmts) {
+                 // bulk version of add_stmt so that a whole code block only
+                 // crosses the binding once
+                 for (auto const &obj : stmts) {
+                     if (py::isinstance<Stmt>(obj)) {
+                         stmt.add_stmt(obj.cast<std::shared_ptr<Stmt>>());
+                     } else if (py::isinstance<FunctionCallVar>(obj)) {
+                         auto var = obj.cast<std::shared_ptr<FunctionCallVar>>();
+                         stmt.add_stmt(std::make_shared<FunctionCallStmt>(var));
+                     } else {
+                         // python statement wrappers such as IfStmt
+                         stmt.add_stmt(obj.attr("stmt")().cast<std::shared_ptr<Stmt>>());
+                     }
+                 }
+             })
         .def("__getitem__",
              [](StmtBlock &stmt, int index) {
                  if (stmt.empty()) {
@@ -122,7 +138,14 @@ void init_stmt(py::module &m) {
         m, "SequentialStmtBlock")
         .def(py::init<>())
         .def("get_conditions", py::overload_cast<>(&SequentialStmtBlock::get_conditions))
-        .def("add_condition", &SequentialStmtBlock::add_condition);
+        .def("add_condition", &SequentialStmtBlock::add_condition)
+        .def("add_conditions",
+             [](SequentialStmtBlock &stmt,
+                const std::vector<std::pair<BlockEdgeType, std::shared_ptr<Var>>> &conditions) {
+                 for (auto const &condition : conditions) {
+                     stmt.add_condition(condition);
+                 }
+             });
 
     py::class_<ModuleInstantiationStmt, ::shared_ptr<ModuleInstantiationStmt>, Stmt>(
         m, "ModuleInstantiationStmt")
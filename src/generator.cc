@@ -25,9 +25,19 @@ Generator &Generator::from_verilog(Context *context, const std::string &src_file
                                    const std::string &top_name,
                                    const std::vector<std::string> &lib_files,
                                    const std::map<std::string, PortType> &port_types) {
+    auto mod = parse_verilog(context, src_file, top_name, lib_files, port_types);
+    context->add(mod.get());
+    return *mod;
+}
+
+std::shared_ptr<Generator> Generator::parse_verilog(
+    Context *context, const std::string &src_file, const std::string &top_name,
+    const std::vector<std::string> &lib_files,
+    const std::map<std::string, PortType> &port_types) {
     if (!fs::exists(src_file)) throw UserException(::format("{0} does not exist", src_file));
 
-    auto &mod = context->generator(top_name);
+    auto mod_p = std::make_shared<Generator>(context, top_name);
+    auto &mod = *mod_p;
     // the src file will be treated a a lib file as well
     mod.lib_files_.reserve(1 + lib_files.size());
     mod.lib_files_.emplace_back(src_file);
@@ -61,7 +71,7 @@ Generator &Generator::from_verilog(Context *context, const std::string &src_file
         port_p->set_port_type(port_type);
     }
 
-    return mod;
+    return mod_p;
 }
 
 Generator::Generator(kratos::Context *context, const std::string &name)
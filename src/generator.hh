@@ -22,6 +22,11 @@ public:
                                    const std::string &top_name,
                                    const std::vector<std::string> &lib_files,
                                    const std::map<std::string, PortType> &port_types);
+    // same as from_verilog, but the generator is not added to the context
+    static std::shared_ptr<Generator> parse_verilog(
+        Context *context, const std::string &src_file, const std::string &top_name,
+        const std::vector<std::string> &lib_files,
+        const std::map<std::string, PortType> &port_types);
 
     Generator(Context *context, const std::string &name);
 
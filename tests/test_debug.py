@@ -450,5 +450,42 @@ def test_ssa_debug():
         conn.close()
 
 
+def test_get_fn_ln_call_site():
+    from kratos.util import get_fn_ln
+
+    def call_site():
+        return get_fn_ln(1)
+
+    results = [call_site() for _ in range(2)]
+    assert results[0] == results[1]
+    fn, ln = results[0]
+    assert fn == os.path.abspath(__file__)
+    # the line of "return get_fn_ln(1)"
+    with open(__file__) as f:
+        assert "return get_fn_ln(1)" in f.readlines()[ln - 1]
+    Generator.clear_context()
+    from kratos.util import _FN_LN_CACHE
+    assert len(_FN_LN_CACHE) == 0
+
+
+def test_get_fn_ln_same_code_different_files():
+    import importlib.util
+    src = "from kratos.util import get_fn_ln\n\n\n" \
+          "def call_site():\n    return get_fn_ln(1)\n"
+    results = []
+    with tempfile.TemporaryDirectory() as temp:
+        for name in ("site_a", "site_b"):
+            filename = os.path.join(temp, name + ".py")
+            with open(filename, "w") as f:
+                f.write(src)
+            spec = importlib.util.spec_from_file_location(name, filename)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            results.append((filename, module.call_site()))
+    for filename, (fn, ln) in results:
+        assert fn == os.path.abspath(filename)
+        assert ln == 5
+
+
 if __name__ == "__main__":
     test_ssa_debug()
@@ -476,6 +476,16 @@ def test_create(check_gold):
     assert mod3.is_cloned
     assert mod3.def_instance == mod1
 
+    class ListMod(Generator):
+        def __init__(self, values, is_clone=False):
+            super().__init__(f"list_mod_{len(values)}", is_clone=is_clone)
+
+    # unhashable values are not cached
+    mod4 = ListMod.create(values=[1, 2])
+    mod5 = ListMod.create(values=[1, 2])
+    assert not mod4.is_cloned
+    assert not mod5.is_cloned
+
     # modify mod 3
     mod3.initialize_clone()
     mod3.in_.width = 3
@@ -2348,6 +2358,292 @@ def test_struct_of_struct(check_gold):
     check_gold(mod, "test_struct_of_struct")
 
 
+def test_code_block_add_stmts():
+    mod = Generator("mod")
+    a = mod.output("a", 1)
+    b = mod.output("b", 1)
+    comb = mod.combinational()
+    comb.add_stmts([a.assign(0), b.assign(a)])
+    src = verilog(mod)["mod"]
+    assert "a = 1'h0;" in src
+    assert "b = a;" in src
+
+
+def test_wire_many():
+    mod = Generator("mod")
+    child = Generator("child")
+    mod.add_child("inst", child)
+    pairs = []
+    for i in range(4):
+        pairs.append((mod.output(f"out{i}", 1), child.output(f"out{i}", 1)))
+        pairs.append((child.input(f"in{i}", 1), mod.input(f"in{i}", 1)))
+    a = mod.var("a", 1)
+    pairs.append((a, mod.ports.in0))
+    stmts = mod.wire_many(pairs, comment="bulk")
+    assert len(stmts) == len(pairs)
+    assert stmts[-1].left.name == "a"
+    # direction is fixed the same way as wire()
+    assert stmts[0].left.name == "out0"
+    assert stmts[1].left.name == "in0"
+    assert stmts[1].left.generator.name == "child"
+
+
+def test_create_cache_key():
+    class Mod(Generator):
+        def __init__(self, a, b, is_clone=False):
+            super().__init__(f"mod_{a}_{b}", is_clone=is_clone)
+
+    mod1 = Mod.create(a=1, b=2)
+    # swapped values used to produce the same cache hash
+    mod2 = Mod.create(a=2, b=1)
+    mod3 = Mod.create(b=2, a=1)
+    assert not mod2.is_cloned
+    assert mod3.is_cloned
+    assert mod3.def_instance == mod1
+
+
+def test_add_always_comment():
+    mod = Generator("mod")
+    a_ = mod.output("a", 1)
+
+    @always_comb
+    def code():
+        a_ = 1
+
+    node = mod.add_always(code, comment="drive a")
+    assert node.comment == "drive a"
+    b = mod.output("b", 1)
+    comb = mod.combinational()
+    if_stmt = comb.if_(a_)
+    if_stmt.then_(b(0)).else_(b(1))
+    comb.comment = "drive b"
+    if_stmt.comment = "check a"
+    assert if_stmt.stmt().comment == "check a"
+    src = verilog(mod)["mod"]
+    assert "// drive a" in src
+    assert "// drive b" in src
+
+
+def test_port_proxy_cache():
+    mod = Generator("mod")
+    a = mod.input("a", 1)
+    assert mod.ports.a.name == "a"
+    assert mod.ports.a is mod.ports.a
+    mod.remove_port("a")
+    with pytest.raises(AttributeError):
+        mod.ports.a
+    a = mod.input("a", 2)
+    assert mod.ports.a.width == 2
+    # renaming natively is picked up by attribute access as well
+    mod.ports.a.name = "a2"
+    assert "a" not in mod.ports
+    with pytest.raises(AttributeError):
+        mod.ports.a
+    assert mod.ports.a2.width == 2
+
+
+def test_create_share_on_cache_hit():
+    class Mod(Generator):
+        _share_on_cache_hit = True
+
+        def __init__(self, width, is_clone=False):
+            super().__init__(f"shared_mod_{width}", is_clone=is_clone)
+            self.input("in", width)
+
+    mod1 = Mod.create(width=4)
+    mod2 = Mod.create(width=4)
+    assert mod1 is mod2
+    assert not mod2.is_cloned
+    mod3 = Mod.create(width=8)
+    assert mod3 is not mod1
+    # the shared instance can't be instantiated twice
+    parent = Generator("parent")
+    parent.add_child("c0", Mod.create(width=4))
+    with pytest.raises(Exception):
+        parent.add_child("c1", Mod.create(width=4))
+    assert "c1" not in parent.child_generator()
+    other = Generator("other")
+    with pytest.raises(Exception):
+        other.add_child("c0", Mod.create(width=4))
+
+
+def test_child_instance_rename():
+    parent = Generator("parent")
+    child = Generator("child")
+    parent.add_child("inst", child)
+    child.instance_name = "inst2"
+    assert "inst2" in parent.child_generator()
+    assert "inst" not in parent.child_generator()
+    parent.remove_child_generator(child)
+    # no longer tracked by the old parent
+    child.instance_name = "inst3"
+    assert "inst3" not in parent.child_generator()
+
+
+def test_clear_context_nested_subclass():
+    class Base(Generator):
+        def __init__(self, width, is_clone=False):
+            super().__init__(f"base_{width}", is_clone=is_clone)
+
+    class Derived(Base):
+        pass
+
+    Derived.create(width=2)
+    assert len(Derived._cache) == 1
+    Generator.clear_context()
+    assert len(Derived._cache) == 0
+
+
+def test_proxy_cache_stale_entries():
+    mod = Generator("mod")
+    x = mod.input("x", 1)
+    y = mod.output("y", 1)
+    mod.wire(y, x)
+    # populate the cache
+    assert mod.ports["x"].name == "x"
+    # renames happen in the native IR
+    x.name = "x2"
+    assert "x" not in mod.ports
+    with pytest.raises(AttributeError):
+        mod.ports["x"]
+    assert mod.ports["x2"].name == "x2"
+    # running the passes drops everything cached so far
+    verilog(mod)
+    assert mod.ports["x2"].name == "x2"
+    assert mod.ports["y"].name == "y"
+
+
+def test_clear_context_src_cache():
+    from kratos.pyast import _CODE_CACHE, _FN_SRC_CACHE
+
+    class Mod(Generator):
+        def __init__(self):
+            super().__init__("mod")
+            self.a = self.output("a", 1)
+            self.add_always(self.code)
+
+        @always_comb
+        def code(self):
+            self.a = 1
+
+    Mod()
+    assert len(_CODE_CACHE) > 0
+    assert len(_FN_SRC_CACHE) > 0
+    Generator.clear_context()
+    assert len(_CODE_CACHE) == 0
+    assert len(_FN_SRC_CACHE) == 0
+
+
+def test_clone_wire_no_fn_ln():
+    mod = Generator("mod", True, is_clone=True)
+    a = mod.var("a", 1)
+    b = mod.var("b", 1)
+    c = mod.var("c", 1)
+    mod.wire(a, b, no_fn_ln=True)
+    mod.wire(c, b)
+    mod.initialize_clone()
+    assert not mod.is_cloned
+    stmts = [mod.get_stmt_by_index(i) for i in range(mod.stmts_count)]
+    assert len(stmts[0].fn_name_ln) == 0
+    assert len(stmts[1].fn_name_ln) == 1
+
+
+def test_wire_many_debug():
+    mod = Generator("mod", True)
+    a = mod.var("a", 1)
+    b = mod.var("b", 1)
+    value = 1
+    stmts = mod.wire_many([(a, b)])
+    fn, ln = stmts[0].fn_name_ln[0]
+    assert fn == os.path.abspath(__file__)
+    with open(__file__) as f:
+        assert "mod.wire_many(" in f.readlines()[ln - 1]
+    scope = stmts[0].scope_context
+    assert scope["value"] == (False, "1")
+    assert scope["a"] == (True, "a")
+
+
+def test_wire_many_clone():
+    class Mod(Generator):
+        def __init__(self, width, is_clone=False):
+            super().__init__(f"mod_{width}", True, is_clone=is_clone)
+            a = self.var("a", width)
+            b = self.var("b", width)
+            self.stmts = self.wire_many([(a, b)])
+
+    mod1 = Mod.create(width=2)
+    mod2 = Mod.create(width=2)
+    assert len(mod1.stmts) == 1
+    assert mod2.is_cloned
+    # the wiring is deferred until the clone is initialized
+    assert mod2.stmts is None
+    assert mod2.stmts_count == 0
+    mod2.initialize_clone()
+    assert mod2.stmts_count == 1
+    stmt = mod2.get_stmt_by_index(0)
+    assert stmt.left.name == "a"
+    # the replay keeps the original call site and scope
+    fn, ln = stmt.fn_name_ln[0]
+    assert fn == os.path.abspath(__file__)
+    with open(__file__) as f:
+        assert "self.wire_many(" in f.readlines()[ln - 1]
+    assert stmt.scope_context["width"] == (False, "2")
+
+
+def test_fn_src_cache_same_code_different_files():
+    import importlib.util
+    from kratos.pyast import get_fn_src
+    src = "def code():\n    return 1\n"
+    fns = []
+    with tempfile.TemporaryDirectory() as temp:
+        for name in ("mod_a", "mod_b"):
+            filename = os.path.join(temp, name + ".py")
+            with open(filename, "w") as f:
+                f.write(src)
+            spec = importlib.util.spec_from_file_location(name, filename)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            fns.append(module.code)
+        # identical code objects compare equal regardless of the file
+        assert fns[0].__code__ == fns[1].__code__
+        filenames = [get_fn_src(fn)[2] for fn in fns]
+    assert filenames[0] != filenames[1]
+    assert filenames[1].endswith("mod_b.py")
+
+
+def test_replace_child_parent():
+    parent = Generator("parent")
+    old = PassThroughMod()
+    parent.add_child("inst", old)
+    new = PassThroughMod()
+    parent.replace("inst", new)
+    assert parent.child_generator()["inst"] is new
+    # the replaced child can be instantiated somewhere else
+    other = Generator("other")
+    other.add_child("inst", old)
+    assert other.child_generator()["inst"] is old
+    # the new child is owned by the parent it was swapped into
+    with pytest.raises(Exception):
+        other.add_child("inst2", new)
+    new.instance_name = "inst2"
+    assert parent.child_generator()["inst2"] is new
+
+
+def test_reg_default_clock_added_later():
+    mod = Generator("mod")
+    mod.clock("clk")
+    a = mod.input("a", 1)
+    b = mod.output("b", 1)
+    c = mod.output("c", 1)
+    mod.wire(b, mod.reg_next("b_reg", a))
+    # "a_clk" sorts first and becomes the default clock
+    mod.clock("a_clk")
+    mod.wire(c, mod.reg_next("c_reg", a))
+    src = verilog(mod)["mod"]
+    assert "always_ff @(posedge clk)" in src
+    assert "always_ff @(posedge a_clk)" in src
+
+
 if __name__ == "__main__":
     from conftest import check_gold_fn
     test_struct_of_struct(check_gold_fn)